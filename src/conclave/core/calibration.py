@@ -4,47 +4,189 @@ Stores human-reviewed findings (confirmed/false-positive) and injects them
 as few-shot examples into agent prompts.
 
 Calibration file: .code-conclave/calibration.yaml
+Parse cache:      .code-conclave/reviews/.calibration.cache.json (written on save,
+                  lives under reviews/ so it stays out of version control)
 """
 
 from __future__ import annotations
 
+import copy
+import json
+import os
 import re
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+# Use libyaml's C loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Parsed calibration per file, stamped with (mtime_ns, size) so edits made
+# outside this process are picked up on the next load. The value is a JSON
+# snapshot (json.loads gives each caller a fresh copy cheaper than deepcopy),
+# or the dict itself when it doesn't survive a JSON round-trip.
+_CALIBRATION_CACHE: dict[Path, tuple[tuple[int, int], str | dict]] = {}
+
+
+def _file_stamp(path: Path) -> tuple[int, int]:
+    """Cheap change detector for a file: (mtime in ns, size in bytes)."""
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _json_snapshot(data: dict) -> Optional[str]:
+    """Serialize data to JSON, or None if the round-trip would change it.
+
+    Hand-edited YAML can hold values JSON can't represent (dates) or would
+    silently convert (non-string keys).
+    """
+    try:
+        text = json.dumps(data, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+    return text if json.loads(text) == data else None
+
+
+def _cache_put(cal_path: Path, stamp: tuple[int, int], data: dict) -> None:
+    """Remember parsed calibration data for this file version."""
+    snapshot = _json_snapshot(data)
+    _CALIBRATION_CACHE[cal_path] = (stamp, snapshot if snapshot is not None else data)
+
+
+def _cache_copy(payload: str | dict) -> dict:
+    """Independent copy of a cached calibration entry."""
+    return json.loads(payload) if isinstance(payload, str) else copy.deepcopy(payload)
+
+
+def _new_file_mode() -> int:
+    """Permissions a plain open() would give a new file under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _atomic_write_text(path: Path, content: str) -> None:
+    """Write a file via a unique temp file in the same directory + os.replace.
+
+    Concurrent writers each get their own temp file (last rename wins), and
+    a failed write never leaves a stray temp file behind.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        # mkstemp creates 0600; match the existing file, or what a plain
+        # write would have created
+        try:
+            mode = path.stat().st_mode & 0o777
+        except OSError:
+            mode = _new_file_mode()
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _sidecar_path(cal_path: Path) -> Path:
+    """Location of the JSON parse cache (under the gitignored reviews/ dir)."""
+    return cal_path.parent / "reviews" / ".calibration.cache.json"
+
+
+def _read_sidecar(cal_path: Path, stamp: tuple[int, int]) -> Optional[dict]:
+    """Return data from the JSON sidecar if it was written for this exact YAML file."""
+    try:
+        cache = json.loads(_sidecar_path(cal_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("source") != list(stamp):
+        return None
+    data = cache.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def _write_sidecar(cal_path: Path, stamp: tuple[int, int], data: dict) -> None:
+    """Best-effort write of the JSON sidecar (save path only). On failure the next load parses YAML."""
+    snapshot = _json_snapshot(data)
+    if snapshot is None:
+        # Data would load back differently from JSON than from YAML
+        return
+    payload = f'{{"source": {json.dumps(list(stamp))}, "data": {snapshot}}}'
+    sidecar = _sidecar_path(cal_path)
+    try:
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write_text(sidecar, payload)
+    except OSError:
+        pass
+
 
 def load_calibration(project_path: Path) -> dict:
-    """Load calibration data from .code-conclave/calibration.yaml."""
+    """Load calibration data from .code-conclave/calibration.yaml.
+
+    The YAML stays the source of truth. Parsed data is kept in memory, and
+    save_calibration also leaves a JSON sidecar; both are tied to the YAML
+    file's (mtime, size), so repeated loads skip YAML parsing until the file
+    changes. Loading never writes to disk.
+
+    Returns a fresh copy on every call, so callers may mutate it freely.
+    """
     cal_path = project_path / ".code-conclave" / "calibration.yaml"
-    if not cal_path.exists():
-        return {"reviewed_findings": [], "project_rules": []}
     try:
-        content = cal_path.read_text(encoding="utf-8-sig")
-        data = yaml.safe_load(content) or {}
-        # Ensure expected keys
-        data.setdefault("reviewed_findings", [])
-        data.setdefault("project_rules", [])
-        return data
-    except Exception:
+        stamp = _file_stamp(cal_path)
+    except OSError:
         return {"reviewed_findings": [], "project_rules": []}
 
+    cached = _CALIBRATION_CACHE.get(cal_path)
+    if cached and cached[0] == stamp:
+        return _cache_copy(cached[1])
+
+    data = _read_sidecar(cal_path, stamp)
+    if data is None:
+        try:
+            content = cal_path.read_text(encoding="utf-8-sig")
+            data = yaml.load(content, Loader=_YAML_LOADER) or {}
+            # Ensure expected keys
+            data.setdefault("reviewed_findings", [])
+            data.setdefault("project_rules", [])
+        except Exception:
+            return {"reviewed_findings": [], "project_rules": []}
+
+    _cache_put(cal_path, stamp, data)
+    return copy.deepcopy(data)
+
 
 def save_calibration(project_path: Path, calibration: dict) -> Path:
-    """Save calibration data to .code-conclave/calibration.yaml."""
+    """Save calibration data to .code-conclave/calibration.yaml.
+
+    Writes to a temp file and renames it over the original, so a crash
+    mid-write never leaves a truncated calibration file behind.
+    """
     cal_path = project_path / ".code-conclave" / "calibration.yaml"
     cal_path.parent.mkdir(parents=True, exist_ok=True)
 
     content = yaml.dump(
         calibration,
+        Dumper=_YAML_DUMPER,
         default_flow_style=False,
         sort_keys=False,
         allow_unicode=True,
         width=120,
     )
-    cal_path.write_text(content, encoding="utf-8")
+    _atomic_write_text(cal_path, content)
+
+    data = copy.deepcopy(calibration)
+    data.setdefault("reviewed_findings", [])
+    data.setdefault("project_rules", [])
+    stamp = _file_stamp(cal_path)
+    _write_sidecar(cal_path, stamp, data)
+    _cache_put(cal_path, stamp, data)
     return cal_path
 
 
@@ -8,11 +8,29 @@ from __future__ import annotations
 import json
 import math
 import re
+import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 
+# Severity -> summary key, in summary output order
+_SUMMARY_KEYS = (("BLOCKER", "blockers"), ("HIGH", "high"), ("MEDIUM", "medium"), ("LOW", "low"))
+
+
+def summarize_findings(findings: list[dict]) -> dict:
+    """Count findings per severity in a single pass.
+
+    Returns {"blockers", "high", "medium", "low", "total"}. Findings with
+    any other severity (e.g. REJECTED) only count toward total.
+    """
+    counts = Counter(f.get("severity", "") for f in findings)
+    summary = {key: counts[sev] for sev, key in _SUMMARY_KEYS}
+    summary["total"] = len(findings)
+    return summary
+
+
 def _get_code_block_ranges(content: str) -> list[tuple[int, int]]:
     """Find all code block regions (```...```) in content."""
     ranges: list[tuple[int, int]] = []
@@ -64,6 +82,10 @@ def parse_findings_markdown(
 
     code_block_ranges = _get_code_block_ranges(content)
 
+    # Severity is matched case-sensitively, so every stored finding carries
+    # an uppercase severity and downstream code can compare it directly.
+    # It is interned so those compares against literals hit the identity
+    # fast path.
     findings: list[dict] = []
     pattern = r"###\s+([A-Z]+-\d+):\s*(.+?)\s*\[(BLOCKER|HIGH|MEDIUM|LOW)\]"
 
@@ -73,7 +95,7 @@ def parse_findings_markdown(
 
         finding_id = match.group(1)
         title = match.group(2).strip()
-        severity = match.group(3)
+        severity = sys.intern(match.group(3))
 
         # Extract section between this header and the next ### or end
         start_pos = match.end()
@@ -154,13 +176,7 @@ def parse_findings_markdown(
         findings.append(finding)
 
     # Summary
-    summary = {
-        "blockers": sum(1 for f in findings if f["severity"] == "BLOCKER"),
-        "high": sum(1 for f in findings if f["severity"] == "HIGH"),
-        "medium": sum(1 for f in findings if f["severity"] == "MEDIUM"),
-        "low": sum(1 for f in findings if f["severity"] == "LOW"),
-        "total": len(findings),
-    }
+    summary = summarize_findings(findings)
 
     # Tokens
     tokens = None
@@ -8,6 +8,7 @@ calibration data.
 from __future__ import annotations
 
 import re
+import sys
 import time
 from pathlib import Path
 from typing import Optional
@@ -16,30 +17,55 @@ from rich.console import Console
 
 from .agents import load_agent_instructions
 from .calibration import build_calibration_context, load_calibration
+from .findings import summarize_findings
 from ..providers.base import AIProvider
 
 console = Console()
 
+# Dash and arrow variants are folded to ASCII before matching, so the pattern
+# only needs "-" and "->"/">". Every replacement is a single character, so
+# match offsets stay valid against the original content.
+_ARROW_TRANS = str.maketrans({"—": "-", "–": "-", "→": ">"})
+
+# Match: ### VALIDATE: GUARDIAN-002 — BLOCKER → LOW (after _ARROW_TRANS)
+# The header is case-insensitive; the **Reason:** anchor is not. The optional
+# reason block is captured inside a lookahead, so only the header advances
+# the scan, and every part of it is tempered against "\n###" so it can never
+# run into (or borrow from) the next section.
+_VALIDATE_RE = re.compile(
+    r"(?i:###\s+VALIDATE:\s+(?P<id>\S+)\s*-\s*(?P<orig>BLOCKER|HIGH|MEDIUM|LOW)\s*"
+    r"-?>\s*(?P<adj>BLOCKER|HIGH|MEDIUM|LOW|REJECTED))"
+    r"(?=(?:(?!\n###).)*?\*\*Reason:\*\*(?:(?!\n###)\s)*"
+    r"(?P<reason>(?:(?!\n###).)*?)(?=\n\n|\n###|\Z))?",
+    re.DOTALL,
+)
+
+_HIGH_SEVERITIES = frozenset({"BLOCKER", "HIGH"})
+
 
 def _collect_high_severity_findings(all_findings: dict[str, dict]) -> list[dict]:
     """Extract BLOCKER and HIGH findings from all agent results."""
-    results = []
-    for agent_key, agent_data in all_findings.items():
-        for finding in agent_data.get("findings", []):
-            severity = finding.get("severity", "").upper()
-            if severity in ("BLOCKER", "HIGH"):
-                results.append({
-                    "agent": agent_key,
-                    "finding_id": finding.get("id", ""),
-                    "title": finding.get("title", ""),
-                    "severity": severity,
-                    "file": finding.get("file", ""),
-                    "line": finding.get("line"),
-                    "description": finding.get("description", ""),
-                    "evidence": finding.get("evidence", ""),
-                    "recommendation": finding.get("recommendation", ""),
-                })
-    return results
+    return [
+        {
+            "agent": agent_key,
+            "finding_id": finding.get("id", ""),
+            "title": finding.get("title", ""),
+            "severity": finding["severity"],
+            "file": finding.get("file", ""),
+            "line": finding.get("line"),
+            "description": finding.get("description", ""),
+            "evidence": finding.get("evidence", ""),
+            "recommendation": finding.get("recommendation", ""),
+        }
+        for agent_key, agent_data in all_findings.items()
+        for finding in agent_data.get("findings", ())
+        if finding.get("severity") in _HIGH_SEVERITIES
+    ]
+
+
+def _make_stats(confirmed: int = 0, downgraded: int = 0, rejected: int = 0, total: int = 0) -> dict:
+    """Build a validation stats dict."""
+    return {"confirmed": confirmed, "downgraded": downgraded, "rejected": rejected, "total": total}
 
 
 def _build_validation_prompt(findings: list[dict], calibration_context: str) -> str:
@@ -81,17 +107,11 @@ def _parse_validation_results(content: str) -> list[dict]:
     """Parse validator output into structured adjustments."""
     adjustments = []
 
-    # Match: ### VALIDATE: GUARDIAN-002 — BLOCKER → LOW
-    # Supports em-dash/en-dash/hyphen and arrow/unicode arrow variants
-    pattern = (
-        r"###\s+VALIDATE:\s+(\S+)\s*(?:—|–|-)\s*(BLOCKER|HIGH|MEDIUM|LOW)\s*"
-        r"(?:→|->)\s*(BLOCKER|HIGH|MEDIUM|LOW|REJECTED)"
-    )
-
-    for m in re.finditer(pattern, content, re.IGNORECASE):
-        finding_id = m.group(1)
-        original = m.group(2).upper()
-        adjusted = m.group(3).upper()
+    for m in _VALIDATE_RE.finditer(content.translate(_ARROW_TRANS)):
+        # Slice free text from the original so its dashes/arrows survive
+        finding_id = content[m.start("id"):m.end("id")]
+        original = sys.intern(m.group("orig").upper())
+        adjusted = sys.intern(m.group("adj").upper())
 
         # Determine decision type
         if adjusted == "REJECTED":
@@ -101,10 +121,7 @@ def _parse_validation_results(content: str) -> list[dict]:
         else:
             decision = "downgraded"
 
-        # Extract reason (look for **Reason:** after this match)
-        reason_pattern = r"\*\*Reason:\*\*\s*(.+?)(?:\n\n|\n###|\Z)"
-        reason_match = re.search(reason_pattern, content[m.end():], re.DOTALL)
-        reason = reason_match.group(1).strip() if reason_match else ""
+        reason = content[m.start("reason"):m.end("reason")].strip() if m.group("reason") else ""
 
         adjustments.append({
             "finding_id": finding_id,
@@ -126,7 +143,7 @@ def _apply_adjustments(
     Returns (adjusted_findings, adjustment_summary).
     """
     adjustment_map = {a["finding_id"]: a for a in adjustments}
-    stats = {"confirmed": 0, "downgraded": 0, "rejected": 0, "total": len(adjustments)}
+    stats = _make_stats(total=len(adjustments))
 
     for agent_key, agent_data in all_findings.items():
         adjusted_findings = []
@@ -158,19 +175,7 @@ def _apply_adjustments(
         agent_data["findings"] = adjusted_findings
 
         # Recalculate summary
-        summary = {"blockers": 0, "high": 0, "medium": 0, "low": 0, "total": 0}
-        for f in adjusted_findings:
-            sev = f.get("severity", "").upper()
-            if sev == "BLOCKER":
-                summary["blockers"] += 1
-            elif sev == "HIGH":
-                summary["high"] += 1
-            elif sev == "MEDIUM":
-                summary["medium"] += 1
-            elif sev == "LOW":
-                summary["low"] += 1
-            summary["total"] += 1
-        agent_data["summary"] = summary
+        agent_data["summary"] = summarize_findings(adjusted_findings)
 
     return all_findings, stats
 
@@ -192,7 +197,7 @@ async def run_validator(
 
     if not high_severity:
         console.print("  [dim]No BLOCKER/HIGH findings to validate[/dim]")
-        return all_findings, {"confirmed": 0, "downgraded": 0, "rejected": 0, "total": 0}
+        return all_findings, _make_stats()
 
     console.print(
         f"\n  [cyan]Validating {len(high_severity)} BLOCKER/HIGH findings...[/cyan]"
@@ -201,12 +206,7 @@ async def run_validator(
     if dry_run:
         # In dry-run, simulate validation (confirm everything)
         console.print("  [dim]DRY RUN: Skipping AI validation[/dim]")
-        return all_findings, {
-            "confirmed": len(high_severity),
-            "downgraded": 0,
-            "rejected": 0,
-            "total": len(high_severity),
-        }
+        return all_findings, _make_stats(confirmed=len(high_severity), total=len(high_severity))
 
     start = time.time()
 
@@ -247,16 +247,11 @@ async def run_validator(
     if not result.success:
         console.print(f"  [yellow]WARN[/yellow] Validator failed: {result.error}")
         console.print("  [dim]Proceeding with original findings[/dim]")
-        return all_findings, {
-            "confirmed": len(high_severity),
-            "downgraded": 0,
-            "rejected": 0,
-            "total": len(high_severity),
-        }
+        return all_findings, _make_stats(confirmed=len(high_severity), total=len(high_severity))
 
     # Save validator raw output for debugging
     val_output_path = project_path / ".code-conclave" / "reviews" / "validator-output.md"
-    val_output_path.write_text(result.content or "", encoding="utf-8")
+    val_output_path.write_bytes((result.content or "").encode("utf-8"))
 
     # Parse and apply adjustments
     adjustments = _parse_validation_results(result.content or "")
@@ -0,0 +1,10 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture
+def cc_tmp(tmp_path):
+    """A tmp project directory with an empty .code-conclave/ already created."""
+    (tmp_path / ".code-conclave").mkdir(parents=True)
+    return tmp_path
@@ -1,9 +1,14 @@
 """Tests for the calibration system."""
 
+import json
+import os
+
+import pytest
 import yaml
 from pathlib import Path
 
 from conclave.core.calibration import (
+    _CALIBRATION_CACHE,
     add_project_rule,
     add_reviewed_finding,
     build_calibration_context,
@@ -18,18 +23,100 @@ class TestLoadSaveCalibration:
         assert cal["reviewed_findings"] == []
         assert cal["project_rules"] == []
 
-    def test_save_and_load_roundtrip(self, tmp_path):
-        (tmp_path / ".code-conclave").mkdir(parents=True)
+    def test_save_and_load_roundtrip(self, cc_tmp):
         data = {
             "reviewed_findings": [{"finding_id": "GUARDIAN-001", "verdict": "confirmed"}],
             "project_rules": [{"rule": "All endpoints use JWT"}],
         }
-        save_calibration(tmp_path, data)
-        loaded = load_calibration(tmp_path)
+        save_calibration(cc_tmp, data)
+        loaded = load_calibration(cc_tmp)
         assert len(loaded["reviewed_findings"]) == 1
         assert loaded["reviewed_findings"][0]["finding_id"] == "GUARDIAN-001"
         assert len(loaded["project_rules"]) == 1
 
+    def test_loaded_copy_is_independent(self, cc_tmp):
+        save_calibration(cc_tmp, {"reviewed_findings": [], "project_rules": []})
+        first = load_calibration(cc_tmp)
+        first["project_rules"].append({"rule": "not saved"})
+        assert load_calibration(cc_tmp)["project_rules"] == []
+
+    def test_external_edit_invalidates_cache(self, cc_tmp):
+        save_calibration(cc_tmp, {"reviewed_findings": [], "project_rules": []})
+        load_calibration(cc_tmp)
+        (cc_tmp / ".code-conclave" / "calibration.yaml").write_text(
+            "reviewed_findings: []\nproject_rules:\n- rule: Edited by hand\n",
+            encoding="utf-8",
+        )
+        cal = load_calibration(cc_tmp)
+        assert cal["project_rules"][0]["rule"] == "Edited by hand"
+
+    def test_json_sidecar_used_across_processes(self, cc_tmp):
+        save_calibration(cc_tmp, {"reviewed_findings": [], "project_rules": [{"rule": "R1"}]})
+        cal_path = cc_tmp / ".code-conclave" / "calibration.yaml"
+        sidecar = cc_tmp / ".code-conclave" / "reviews" / ".calibration.cache.json"
+        cache = json.loads(sidecar.read_text(encoding="utf-8"))
+        assert cache["data"]["project_rules"] == [{"rule": "R1"}]
+
+        # Plant different data under the current stamp: a fresh process
+        # (no in-memory cache) must return the sidecar's data, not re-parse YAML
+        st = cal_path.stat()
+        cache["source"] = [st.st_mtime_ns, st.st_size]
+        cache["data"]["project_rules"] = [{"rule": "From sidecar"}]
+        sidecar.write_text(json.dumps(cache), encoding="utf-8")
+        _CALIBRATION_CACHE.clear()
+        assert load_calibration(cc_tmp)["project_rules"] == [{"rule": "From sidecar"}]
+
+    def test_lossy_json_data_skips_sidecar(self, cc_tmp):
+        data = {"reviewed_findings": [], "project_rules": [], "severity_map": {1: "HIGH"}}
+        save_calibration(cc_tmp, data)
+        assert not (cc_tmp / ".code-conclave" / "reviews" / ".calibration.cache.json").exists()
+
+        _CALIBRATION_CACHE.clear()
+        assert load_calibration(cc_tmp)["severity_map"] == {1: "HIGH"}
+
+    def test_sidecar_not_written_next_to_yaml(self, cc_tmp):
+        save_calibration(cc_tmp, {"reviewed_findings": [], "project_rules": []})
+        assert sorted(p.name for p in (cc_tmp / ".code-conclave").iterdir()) == [
+            "calibration.yaml",
+            "reviews",
+        ]
+
+    def test_load_does_not_write(self, cc_tmp):
+        (cc_tmp / ".code-conclave" / "calibration.yaml").write_text(
+            "reviewed_findings: []\nproject_rules:\n- rule: Hand-written\n",
+            encoding="utf-8",
+        )
+        build_calibration_context(cc_tmp, "guardian")
+        assert [p.name for p in (cc_tmp / ".code-conclave").iterdir()] == ["calibration.yaml"]
+
+    def test_stale_json_sidecar_ignored(self, cc_tmp):
+        save_calibration(cc_tmp, {"reviewed_findings": [], "project_rules": []})
+        (cc_tmp / ".code-conclave" / "calibration.yaml").write_text(
+            "reviewed_findings: []\nproject_rules:\n- rule: Newer YAML\n",
+            encoding="utf-8",
+        )
+        _CALIBRATION_CACHE.clear()
+        assert load_calibration(cc_tmp)["project_rules"][0]["rule"] == "Newer YAML"
+
+    def test_failed_save_leaves_no_temp_file(self, cc_tmp, monkeypatch):
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("conclave.core.calibration.os.replace", fail_replace)
+        with pytest.raises(OSError):
+            save_calibration(cc_tmp, {"reviewed_findings": [], "project_rules": []})
+        assert list((cc_tmp / ".code-conclave").iterdir()) == []
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_new_file_respects_umask(self, cc_tmp):
+        old_umask = os.umask(0o077)
+        try:
+            save_calibration(cc_tmp, {"reviewed_findings": [], "project_rules": []})
+        finally:
+            os.umask(old_umask)
+        mode = (cc_tmp / ".code-conclave" / "calibration.yaml").stat().st_mode & 0o777
+        assert mode == 0o600
+
     def test_load_with_bom(self, tmp_path):
         """Files with BOM should load correctly."""
         cc_dir = tmp_path / ".code-conclave"
@@ -52,10 +139,9 @@ class TestLoadSaveCalibration:
 
 
 class TestAddReviewedFinding:
-    def test_add_false_positive(self, tmp_path):
-        (tmp_path / ".code-conclave").mkdir(parents=True)
+    def test_add_false_positive(self, cc_tmp):
         entry = add_reviewed_finding(
-            tmp_path,
+            cc_tmp,
             finding_id="GUARDIAN-002",
             agent="guardian",
             original_severity="BLOCKER",
@@ -69,14 +155,13 @@ class TestAddReviewedFinding:
         assert entry["verdict"] == "false_positive"
 
         # Verify it persisted
-        cal = load_calibration(tmp_path)
+        cal = load_calibration(cc_tmp)
         assert len(cal["reviewed_findings"]) == 1
         assert cal["reviewed_findings"][0]["original_severity"] == "BLOCKER"
 
-    def test_add_adjusted(self, tmp_path):
-        (tmp_path / ".code-conclave").mkdir(parents=True)
+    def test_add_adjusted(self, cc_tmp):
         add_reviewed_finding(
-            tmp_path,
+            cc_tmp,
             finding_id="GUARDIAN-003",
             agent="guardian",
             original_severity="HIGH",
@@ -84,29 +169,27 @@ class TestAddReviewedFinding:
             verdict="adjusted",
             reason="Internal endpoint only",
         )
-        cal = load_calibration(tmp_path)
+        cal = load_calibration(cc_tmp)
         assert cal["reviewed_findings"][0]["adjusted_severity"] == "LOW"
 
-    def test_replaces_existing_finding(self, tmp_path):
-        (tmp_path / ".code-conclave").mkdir(parents=True)
+    def test_replaces_existing_finding(self, cc_tmp):
         add_reviewed_finding(
-            tmp_path, "GUARDIAN-001", "guardian", "BLOCKER", "BLOCKER",
+            cc_tmp, "GUARDIAN-001", "guardian", "BLOCKER", "BLOCKER",
             "confirmed", "Real issue",
         )
         add_reviewed_finding(
-            tmp_path, "GUARDIAN-001", "guardian", "BLOCKER", "MEDIUM",
+            cc_tmp, "GUARDIAN-001", "guardian", "BLOCKER", "MEDIUM",
             "adjusted", "Actually not that bad",
         )
-        cal = load_calibration(tmp_path)
+        cal = load_calibration(cc_tmp)
         assert len(cal["reviewed_findings"]) == 1
         assert cal["reviewed_findings"][0]["verdict"] == "adjusted"
 
 
 class TestAddProjectRule:
-    def test_add_rule(self, tmp_path):
-        (tmp_path / ".code-conclave").mkdir(parents=True)
+    def test_add_rule(self, cc_tmp):
         entry = add_project_rule(
-            tmp_path,
+            cc_tmp,
             rule="All /api/v1/admin/ endpoints require JWT auth",
             applies_to="guardian",
             severity_cap="MEDIUM",
@@ -114,14 +197,13 @@ class TestAddProjectRule:
         assert entry["rule"].startswith("All /api/v1/admin/")
         assert entry["severity_cap"] == "MEDIUM"
 
-        cal = load_calibration(tmp_path)
+        cal = load_calibration(cc_tmp)
         assert len(cal["project_rules"]) == 1
 
-    def test_add_multiple_rules(self, tmp_path):
-        (tmp_path / ".code-conclave").mkdir(parents=True)
-        add_project_rule(tmp_path, "Rule 1")
-        add_project_rule(tmp_path, "Rule 2")
-        cal = load_calibration(tmp_path)
+    def test_add_multiple_rules(self, cc_tmp):
+        add_project_rule(cc_tmp, "Rule 1")
+        add_project_rule(cc_tmp, "Rule 2")
+        cal = load_calibration(cc_tmp)
         assert len(cal["project_rules"]) == 2
 
 
@@ -130,71 +212,65 @@ class TestBuildCalibrationContext:
         ctx = build_calibration_context(tmp_path, "guardian")
         assert ctx == ""
 
-    def test_false_positive_context(self, tmp_path):
-        (tmp_path / ".code-conclave").mkdir(parents=True)
+    def test_false_positive_context(self, cc_tmp):
         add_reviewed_finding(
-            tmp_path, "GUARDIAN-002", "guardian", "BLOCKER", "REJECTED",
+            cc_tmp, "GUARDIAN-002", "guardian", "BLOCKER", "REJECTED",
             "false_positive", "ORM is parameterized",
             file_path="services/search.py",
             title="SQL Wildcard Injection",
         )
-        ctx = build_calibration_context(tmp_path, "guardian")
+        ctx = build_calibration_context(cc_tmp, "guardian")
         assert "CALIBRATION DATA" in ctx
         assert "False Positives" in ctx
         assert "GUARDIAN-002" in ctx
         assert "ORM is parameterized" in ctx
 
-    def test_adjusted_context(self, tmp_path):
-        (tmp_path / ".code-conclave").mkdir(parents=True)
+    def test_adjusted_context(self, cc_tmp):
         add_reviewed_finding(
-            tmp_path, "GUARDIAN-003", "guardian", "HIGH", "LOW",
+            cc_tmp, "GUARDIAN-003", "guardian", "HIGH", "LOW",
             "adjusted", "Admin endpoint",
             title="Missing Rate Limit",
         )
-        ctx = build_calibration_context(tmp_path, "guardian")
+        ctx = build_calibration_context(cc_tmp, "guardian")
         assert "Severity Adjustments" in ctx
         assert "was HIGH, adjusted to LOW" in ctx
 
-    def test_confirmed_context(self, tmp_path):
-        (tmp_path / ".code-conclave").mkdir(parents=True)
+    def test_confirmed_context(self, cc_tmp):
         add_reviewed_finding(
-            tmp_path, "GUARDIAN-001", "guardian", "BLOCKER", "BLOCKER",
+            cc_tmp, "GUARDIAN-001", "guardian", "BLOCKER", "BLOCKER",
             "confirmed", "Real hardcoded key",
             title="Hardcoded API Key",
         )
-        ctx = build_calibration_context(tmp_path, "guardian")
+        ctx = build_calibration_context(cc_tmp, "guardian")
         assert "True Positives" in ctx
         assert "confirmed" in ctx
 
-    def test_filters_by_agent(self, tmp_path):
-        (tmp_path / ".code-conclave").mkdir(parents=True)
+    def test_filters_by_agent(self, cc_tmp):
         add_reviewed_finding(
-            tmp_path, "GUARDIAN-001", "guardian", "BLOCKER", "REJECTED",
+            cc_tmp, "GUARDIAN-001", "guardian", "BLOCKER", "REJECTED",
             "false_positive", "FP reason",
         )
         add_reviewed_finding(
-            tmp_path, "SENTINEL-001", "sentinel", "HIGH", "REJECTED",
+            cc_tmp, "SENTINEL-001", "sentinel", "HIGH", "REJECTED",
             "false_positive", "Different agent FP",
         )
         # Guardian context should only show Guardian findings
-        ctx = build_calibration_context(tmp_path, "guardian")
+        ctx = build_calibration_context(cc_tmp, "guardian")
         assert "GUARDIAN-001" in ctx
         assert "SENTINEL-001" not in ctx
 
-    def test_project_rules_included(self, tmp_path):
-        (tmp_path / ".code-conclave").mkdir(parents=True)
-        add_project_rule(tmp_path, "All admin endpoints behind auth", "guardian")
-        ctx = build_calibration_context(tmp_path, "guardian")
+    def test_project_rules_included(self, cc_tmp):
+        add_project_rule(cc_tmp, "All admin endpoints behind auth", "guardian")
+        ctx = build_calibration_context(cc_tmp, "guardian")
         assert "Project-Specific Rules" in ctx
         assert "admin endpoints" in ctx
 
-    def test_project_rules_filter_by_agent(self, tmp_path):
-        (tmp_path / ".code-conclave").mkdir(parents=True)
-        add_project_rule(tmp_path, "Guardian-only rule", "guardian")
-        add_project_rule(tmp_path, "All-agent rule", "all")
-        add_project_rule(tmp_path, "Sentinel-only rule", "sentinel")
+    def test_project_rules_filter_by_agent(self, cc_tmp):
+        add_project_rule(cc_tmp, "Guardian-only rule", "guardian")
+        add_project_rule(cc_tmp, "All-agent rule", "all")
+        add_project_rule(cc_tmp, "Sentinel-only rule", "sentinel")
 
-        ctx = build_calibration_context(tmp_path, "guardian")
+        ctx = build_calibration_context(cc_tmp, "guardian")
         assert "Guardian-only rule" in ctx
         assert "All-agent rule" in ctx
         assert "Sentinel-only rule" not in ctx
@@ -152,6 +152,42 @@ VALIDATION COMPLETE: 1 confirmed, 1 downgraded, 1 rejected out of 3 total
         assert len(results) == 1
         assert results[0]["adjusted_severity"] == "MEDIUM"
 
+    def test_reason_keeps_original_punctuation(self):
+        content = "### VALIDATE: G-001 – HIGH → LOW\n**Reason:** Input → ORM — parameterized.\n"
+        results = _parse_validation_results(content)
+        assert len(results) == 1
+        assert results[0]["reason"] == "Input → ORM — parameterized."
+
+    def test_header_case_insensitive_reason_anchor_not(self):
+        content = "### validate: G-001 — high → low\n**reason:** lower-case anchor\n"
+        results = _parse_validation_results(content)
+        assert len(results) == 1
+        assert results[0]["adjusted_severity"] == "LOW"
+        assert results[0]["reason"] == ""
+
+    def test_empty_reason_does_not_swallow_next_section(self):
+        content = (
+            "### VALIDATE: GUARDIAN-001 — BLOCKER → LOW\n**Reason:**\n\n"
+            "### VALIDATE: GUARDIAN-002 — HIGH → REJECTED\n**Reason:** Test fixture, not prod.\n"
+        )
+        results = _parse_validation_results(content)
+        assert [r["finding_id"] for r in results] == ["GUARDIAN-001", "GUARDIAN-002"]
+        assert results[0]["reason"] == ""
+        assert results[1]["decision"] == "rejected"
+
+    def test_reason_not_borrowed_from_next_section(self):
+        content = """
+### VALIDATE: GUARDIAN-001 — BLOCKER → BLOCKER
+**Decision:** CONFIRMED
+
+### VALIDATE: GUARDIAN-002 — HIGH → LOW
+**Reason:** Internal tool only.
+"""
+        results = _parse_validation_results(content)
+        assert len(results) == 2
+        assert results[0]["reason"] == ""
+        assert results[1]["reason"] == "Internal tool only."
+
 
 class TestApplyAdjustments:
     def _make_findings(self):